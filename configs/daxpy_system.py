@@ -0,0 +1,81 @@
+import os
+
+import m5
+from m5.objects import *
+from m5.util import fatal
+
+def get_processes(binary_path, binary_args):
+    """Create the process to be executed"""
+    
+    if not os.path.isfile(binary_path):
+        fatal(f"Binary {binary_path} not found!")
+    
+    process = Process()
+    process.executable = binary_path
+    process.cmd = [binary_path] + binary_args
+    process.cwd = os.getcwd()
+    
+    return process
+
+def create_system(options):
+    """Create the gem5 system"""
+    
+    # Create the system
+    system = System()
+    
+    # Set the clock domain
+    system.clk_domain = SrcClockDomain()
+    system.clk_domain.clock = options.sys_clock
+    system.clk_domain.voltage_domain = VoltageDomain()
+    
+    # Create memory ranges
+    system.mem_ranges = [AddrRange('512MB')]
+    
+    # Create CPUs - simple timing CPU for basic simulation
+    system.cpu = [TimingSimpleCPU() for i in range(options.num_cpus)]
+    
+    # Create memory bus
+    system.membus = SystemXBar()
+    
+    # Simple cache setup
+    if options.caches:
+        for i, cpu in enumerate(system.cpu):
+            # Create L1 caches
+            cpu.icache = Cache(size="16kB", assoc=2, tag_latency=2, data_latency=2, response_latency=2, mshrs=4, tgts_per_mshr=20)
+            cpu.dcache = Cache(size="64kB", assoc=2, tag_latency=2, data_latency=2, response_latency=2, mshrs=4, tgts_per_mshr=20)
+            
+            # Connect caches
+            cpu.icache.mem_side = system.membus.cpu_side_ports
+            cpu.dcache.mem_side = system.membus.cpu_side_ports
+            cpu.icache_port = cpu.icache.cpu_side
+            cpu.dcache_port = cpu.dcache.cpu_side
+    else:
+        # No caches - direct connection
+        for cpu in system.cpu:
+            cpu.icache_port = system.membus.cpu_side_ports
+            cpu.dcache_port = system.membus.cpu_side_ports
+    
+    # Create memory controller
+    system.mem_ctrl = MemCtrl()
+    system.mem_ctrl.dram = DDR3_1600_8x8()
+    system.mem_ctrl.dram.range = system.mem_ranges[0]
+    system.mem_ctrl.port = system.membus.mem_side_ports
+    
+    # Create interrupt controllers
+    # APIC-to-APIC messages get their own bus so membus only fans out to
+    # the ports that carry memory traffic; pio stays on membus because
+    # CPU accesses to the APIC registers arrive through it
+    has_apic = hasattr(m5.objects, 'X86LocalApic')
+    if has_apic:
+        system.intbus = IOXBar()
+    for cpu in system.cpu:
+        cpu.createInterruptController()
+        if has_apic:
+            cpu.interrupts[0].pio = system.membus.mem_side_ports
+            cpu.interrupts[0].int_requestor = system.intbus.cpu_side_ports
+            cpu.interrupts[0].int_responder = system.intbus.mem_side_ports
+    
+    # Connect system port
+    system.system_port = system.membus.cpu_side_ports
+    
+    return system
@@ -0,0 +1,183 @@
+import os
+
+import m5
+from m5.objects import *
+from m5.util import fatal
+
+class L1ICache(Cache):
+    """Private L1 instruction cache"""
+    size = '32kB'
+    assoc = 2
+    tag_latency = 2
+    data_latency = 2
+    response_latency = 2
+    mshrs = 4
+    tgts_per_mshr = 20
+
+class L1DCache(Cache):
+    """Private L1 data cache"""
+    size = '32kB'
+    assoc = 8
+    tag_latency = 2
+    data_latency = 2
+    response_latency = 2
+    mshrs = 4
+    tgts_per_mshr = 20
+
+class L2Cache(Cache):
+    """Shared L2 cache"""
+    size = '256kB'
+    assoc = 8
+    tag_latency = 20
+    data_latency = 20
+    response_latency = 20
+    mshrs = 20
+    tgts_per_mshr = 12
+
+class CustomMinorFUPool(MinorFUPool):
+    """Custom FU Pool with configurable FloatSimdFU"""
+    def __init__(self, float_simd_op_lat=1, float_simd_issue_lat=6):
+        # Ensure opLat + issueLat = 7 before the default FU list is built
+        if float_simd_op_lat + float_simd_issue_lat != 7:
+            fatal(f"FloatSimdFU opLat ({float_simd_op_lat}) + issueLat ({float_simd_issue_lat}) must equal 7")
+        
+        super(CustomMinorFUPool, self).__init__()
+        
+        # Define the custom functional units
+        self.funcUnits = [
+            # Integer ALU - keep default
+            MinorFU(opClasses=['IntAlu'], opLat=3, issueLat=1),
+            
+            # Integer multiply/divide
+            MinorFU(opClasses=['IntMult', 'IntDiv'], opLat=3, issueLat=9),
+            
+            # Load/Store unit  
+            MinorFU(opClasses=['MemRead', 'MemWrite'], opLat=1, issueLat=1),
+            
+            # Floating point ALU
+            MinorFU(opClasses=['FloatAdd', 'FloatCmp', 'FloatCvt'], opLat=2, issueLat=1),
+            
+            # Floating point multiply/divide
+            MinorFU(opClasses=['FloatMult', 'FloatDiv', 'FloatSqrt'], opLat=4, issueLat=1),
+            
+            # CUSTOMIZABLE FloatSimd functional unit
+            MinorFU(opClasses=['FloatSIMD'], 
+                   opLat=float_simd_op_lat, 
+                   issueLat=float_simd_issue_lat),
+            
+            # SIMD multiply and divide/sqrt; gem5's defaults leave these at opLat=1
+            MinorFU(opClasses=['SimdMult', 'SimdMultAcc'], opLat=4, issueLat=1),
+            MinorFU(opClasses=['SimdDiv', 'SimdSqrt'], opLat=9, issueLat=9),
+            
+            # Miscellaneous
+            MinorFU(opClasses=['IprAccess', 'InstPrefetch'], opLat=1, issueLat=1),
+        ]
+
+def get_processes(binary_path, binary_args):
+    """Create the process to be executed"""
+    
+    if not os.path.isfile(binary_path):
+        fatal(f"Binary {binary_path} not found!")
+    
+    process = Process()
+    process.executable = binary_path
+    process.cmd = [binary_path] + binary_args
+    process.cwd = os.getcwd()
+    
+    return process
+
+def create_system(options):
+    """Create the gem5 system with MinorCPU"""
+    
+    # Create the system
+    system = System()
+    
+    # Set the clock domain
+    system.clk_domain = SrcClockDomain()
+    system.clk_domain.clock = options.sys_clock
+    system.clk_domain.voltage_domain = VoltageDomain()
+    
+    # Create memory ranges
+    system.mem_ranges = [AddrRange('512MB')]
+    
+    # Create MinorCPUs with custom FU pool
+    minor_cpus = []
+    for i in range(options.num_cpus):
+        cpu = MinorCPU(cpu_id=i)
+        # Assign custom FU pool with specified FloatSimd configuration
+        cpu.executeFuncUnits = CustomMinorFUPool(
+            float_simd_op_lat=options.float_simd_op_lat,
+            float_simd_issue_lat=options.float_simd_issue_lat
+        )
+        minor_cpus.append(cpu)
+    
+    if options.fast_forward:
+        # AtomicSimpleCPUs run the setup phase and own the port connections;
+        # m5.switchCpus() later hands them over to the switched-out MinorCPUs
+        system.mem_mode = 'atomic'
+        system.cpu = [AtomicSimpleCPU(cpu_id=i, max_insts_any_thread=options.fast_forward)
+                      for i in range(options.num_cpus)]
+        for cpu in minor_cpus:
+            cpu.switched_out = True
+        system.switch_cpus = minor_cpus
+    else:
+        system.mem_mode = 'timing'
+        system.cpu = minor_cpus
+    
+    # Create memory bus
+    system.membus = SystemXBar()
+    
+    # Cache setup
+    if options.caches:
+        # Create L2 cache if requested
+        if options.l2cache:
+            system.l2 = L2Cache(size=options.l2_size, assoc=options.l2_assoc)
+            system.l2.mem_side = system.membus.cpu_side_ports
+            system.tol2bus = L2XBar()
+            system.l2.cpu_side = system.tol2bus.mem_side_ports
+            
+        for i, cpu in enumerate(system.cpu):
+            # Create L1 caches for each CPU
+            cpu.icache = L1ICache()
+            cpu.dcache = L1DCache(size=options.l1d_size, assoc=options.l1d_assoc)
+            
+            # Connect caches
+            cpu.icache_port = cpu.icache.cpu_side
+            cpu.dcache_port = cpu.dcache.cpu_side
+            
+            if options.l2cache:
+                cpu.icache.mem_side = system.tol2bus.cpu_side_ports
+                cpu.dcache.mem_side = system.tol2bus.cpu_side_ports
+            else:
+                cpu.icache.mem_side = system.membus.cpu_side_ports
+                cpu.dcache.mem_side = system.membus.cpu_side_ports
+    else:
+        # No caches - direct connection
+        for cpu in system.cpu:
+            cpu.icache_port = system.membus.cpu_side_ports
+            cpu.dcache_port = system.membus.cpu_side_ports
+    
+    # Create memory controller
+    system.mem_ctrl = MemCtrl()
+    system.mem_ctrl.dram = DDR3_1600_8x8()
+    system.mem_ctrl.dram.range = system.mem_ranges[0]
+    system.mem_ctrl.port = system.membus.mem_side_ports
+    
+    # Create interrupt controllers for each CPU
+    # APIC-to-APIC messages get their own bus so membus only fans out to
+    # the ports that carry memory traffic; pio stays on membus because
+    # CPU accesses to the APIC registers arrive through it
+    has_apic = hasattr(m5.objects, 'X86LocalApic')
+    if has_apic:
+        system.intbus = IOXBar()
+    for cpu in system.cpu:
+        cpu.createInterruptController()
+        if has_apic:
+            cpu.interrupts[0].pio = system.membus.mem_side_ports
+            cpu.interrupts[0].int_requestor = system.intbus.cpu_side_ports
+            cpu.interrupts[0].int_responder = system.intbus.mem_side_ports
+    
+    # Connect system port
+    system.system_port = system.membus.cpu_side_ports
+    
+    return system
@@ -1,57 +1,33 @@
 #!/usr/bin/env python3
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # headless batch plotting, no GUI event loop
 import matplotlib.pyplot as plt
 import numpy as np
 import sys
 import os
 
+FAILED_MARKERS = {'FAILED', 'ERROR', 'N/A'}
+NUMERIC_COLS = ['SimSeconds', 'TotalCycles', 'AvgIPC', 'TotalInstructions']
+CSV_COLUMNS = ['Configuration', 'OpLat', 'IssueLat', 'Threads'] + NUMERIC_COLS
+CSV_DTYPES = {'Threads': 'int16', 'OpLat': 'int8', 'IssueLat': 'int8'}
+
 def analyze_results(csv_file):
     """Analyze the performance results and generate plots"""
     
     print("Loading results from:", csv_file)
-    df = pd.read_csv(csv_file)
+    # Failure markers become NaN in the tokenizer, so numeric columns parse directly
+    df = pd.read_csv(csv_file, usecols=CSV_COLUMNS, dtype=CSV_DTYPES,
+                     na_values=FAILED_MARKERS)
     
     # Remove failed experiments
-    df = df[df['SimSeconds'] != 'FAILED']
-    df = df[df['SimSeconds'] != 'ERROR']
-    df = df[df['SimSeconds'] != 'N/A']
-    
-    # Convert to numeric
-    df['SimSeconds'] = pd.to_numeric(df['SimSeconds'])
-    df['TotalCycles'] = pd.to_numeric(df['TotalCycles'])
-    df['AvgIPC'] = pd.to_numeric(df['AvgIPC'])
+    df.dropna(subset=NUMERIC_COLS, inplace=True)
     
     print("\nDataset overview:")
     print(df.head())
     
-    # Analysis 1: Performance vs Configuration for different thread counts
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-    fig.suptitle('FloatSimdFU Performance Analysis', fontsize=16)
-    
-    # Plot 1: Simulation time vs OpLat for different thread counts
-    for threads in sorted(df['Threads'].unique()):
-        thread_data = df[df['Threads'] == threads]
-        axes[0,0].plot(thread_data['OpLat'], thread_data['SimSeconds'], 
-                      marker='o', label=f'{threads} threads')
-    axes[0,0].set_xlabel('Operation Latency (cycles)')
-    axes[0,0].set_ylabel('Simulation Time (seconds)')
-    axes[0,0].set_title('Simulation Time vs OpLat')
-    axes[0,0].legend()
-    axes[0,0].grid(True, alpha=0.3)
-    
-    # Plot 2: IPC vs OpLat
-    for threads in sorted(df['Threads'].unique()):
-        thread_data = df[df['Threads'] == threads]
-        axes[0,1].plot(thread_data['OpLat'], thread_data['AvgIPC'], 
-                      marker='s', label=f'{threads} threads')
-    axes[0,1].set_xlabel('Operation Latency (cycles)')
-    axes[0,1].set_ylabel('Instructions Per Cycle (IPC)')
-    axes[0,1].set_title('IPC vs OpLat')
-    axes[0,1].legend()
-    axes[0,1].grid(True, alpha=0.3)
-    
-    # Plot 3: Speedup calculation (comparing to single thread)
+    # Speedup calculation (comparing to single thread)
     single_thread_data = df[df['Threads'] == 1]
     speedup_data = []
     
@@ -71,36 +47,71 @@ def analyze_results(csv_file):
                 })
     
     speedup_df = pd.DataFrame(speedup_data)
-    
-    if not speedup_df.empty:
-        for threads in sorted(speedup_df['Threads'].unique()):
-            thread_data = speedup_df[speedup_df['Threads'] == threads]
-            axes[1,0].plot(thread_data['OpLat'], thread_data['Speedup'], 
-                          marker='^', label=f'{threads} threads')
-    axes[1,0].set_xlabel('Operation Latency (cycles)')
-    axes[1,0].set_ylabel('Parallel Speedup')
-    axes[1,0].set_title('Parallel Speedup vs OpLat')
-    axes[1,0].legend()
-    axes[1,0].grid(True, alpha=0.3)
-    axes[1,0].axhline(y=1, color='r', linestyle='--', alpha=0.5, label='No speedup')
-    
-    # Plot 4: Efficiency (Speedup/Threads)
-    if not speedup_df.empty:
+    has_speedup = not speedup_df.empty
+    if has_speedup:
         speedup_df['Efficiency'] = speedup_df['Speedup'] / speedup_df['Threads']
-        for threads in sorted(speedup_df['Threads'].unique()):
-            thread_data = speedup_df[speedup_df['Threads'] == threads]
-            axes[1,1].plot(thread_data['OpLat'], thread_data['Efficiency'], 
-                          marker='d', label=f'{threads} threads')
-    axes[1,1].set_xlabel('Operation Latency (cycles)')
-    axes[1,1].set_ylabel('Parallel Efficiency')
-    axes[1,1].set_title('Parallel Efficiency vs OpLat')
-    axes[1,1].legend()
-    axes[1,1].grid(True, alpha=0.3)
-    axes[1,1].axhline(y=1, color='r', linestyle='--', alpha=0.5, label='Perfect efficiency')
     
-    plt.tight_layout()
-    plt.savefig('floatsimd_analysis.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    # Analysis 1: Performance vs Configuration for different thread counts
+    # Without multi-thread results the speedup/efficiency row would be blank, so skip it
+    if has_speedup:
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    else:
+        fig, axes = plt.subplots(1, 2, figsize=(15, 5), squeeze=False)
+    try:
+        fig.suptitle('FloatSimdFU Performance Analysis', fontsize=16)
+        
+        # Plot 1: Simulation time vs OpLat for different thread counts
+        for threads in sorted(df['Threads'].unique()):
+            thread_data = df[df['Threads'] == threads]
+            axes[0,0].plot(thread_data['OpLat'], thread_data['SimSeconds'], 
+                          marker='o', label=f'{threads} threads')
+        axes[0,0].set_xlabel('Operation Latency (cycles)')
+        axes[0,0].set_ylabel('Simulation Time (seconds)')
+        axes[0,0].set_title('Simulation Time vs OpLat')
+        axes[0,0].legend()
+        axes[0,0].grid(True, alpha=0.3)
+        
+        # Plot 2: IPC vs OpLat
+        for threads in sorted(df['Threads'].unique()):
+            thread_data = df[df['Threads'] == threads]
+            axes[0,1].plot(thread_data['OpLat'], thread_data['AvgIPC'], 
+                          marker='s', label=f'{threads} threads')
+        axes[0,1].set_xlabel('Operation Latency (cycles)')
+        axes[0,1].set_ylabel('Instructions Per Cycle (IPC)')
+        axes[0,1].set_title('IPC vs OpLat')
+        axes[0,1].legend()
+        axes[0,1].grid(True, alpha=0.3)
+        
+        if has_speedup:
+            # Plot 3: Parallel speedup
+            for threads in sorted(speedup_df['Threads'].unique()):
+                thread_data = speedup_df[speedup_df['Threads'] == threads]
+                axes[1,0].plot(thread_data['OpLat'], thread_data['Speedup'], 
+                              marker='^', label=f'{threads} threads')
+            axes[1,0].set_xlabel('Operation Latency (cycles)')
+            axes[1,0].set_ylabel('Parallel Speedup')
+            axes[1,0].set_title('Parallel Speedup vs OpLat')
+            axes[1,0].legend()
+            axes[1,0].grid(True, alpha=0.3)
+            axes[1,0].axhline(y=1, color='r', linestyle='--', alpha=0.5, label='No speedup')
+            
+            # Plot 4: Efficiency (Speedup/Threads)
+            for threads in sorted(speedup_df['Threads'].unique()):
+                thread_data = speedup_df[speedup_df['Threads'] == threads]
+                axes[1,1].plot(thread_data['OpLat'], thread_data['Efficiency'], 
+                              marker='d', label=f'{threads} threads')
+            axes[1,1].set_xlabel('Operation Latency (cycles)')
+            axes[1,1].set_ylabel('Parallel Efficiency')
+            axes[1,1].set_title('Parallel Efficiency vs OpLat')
+            axes[1,1].legend()
+            axes[1,1].grid(True, alpha=0.3)
+            axes[1,1].axhline(y=1, color='r', linestyle='--', alpha=0.5, label='Perfect efficiency')
+        
+        plt.tight_layout()
+        plt.savefig('floatsimd_analysis.png', dpi=150, bbox_inches='tight')
+    finally:
+        # Always release the figure so repeated runs keep a flat memory ceiling
+        plt.close(fig)
     
     # Generate summary table
     print("\n" + "="*80)
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # headless batch plotting, no GUI event loop
 import matplotlib.pyplot as plt
 import numpy as np
 import sys
 import os
 
+NUMERIC_COLS = ['SimSeconds', 'TotalCycles', 'AvgIPC', 'TotalInstructions']
+
 def analyze_results(csv_file):
     """Analyze the performance results and generate plots"""
     
@@ -28,9 +32,8 @@ def analyze_results(csv_file):
     print(f"\nFound {len(success_df)} successful experiments")
     
     # Convert to numeric
-    success_df['SimSeconds'] = pd.to_numeric(success_df['SimSeconds'], errors='coerce')
-    success_df['TotalCycles'] = pd.to_numeric(success_df['TotalCycles'], errors='coerce')
-    success_df['AvgIPC'] = pd.to_numeric(success_df['AvgIPC'], errors='coerce')
+    success_df[NUMERIC_COLS] = success_df[NUMERIC_COLS].apply(pd.to_numeric, errors='coerce')
+    success_df.dropna(subset=NUMERIC_COLS, inplace=True)
     
     print("\nSuccessful dataset overview:")
     print(success_df.head())
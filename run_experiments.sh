@@ -204,125 +204,158 @@ cat << 'EOF' > "$ANALYSIS_SCRIPT"
 #!/usr/bin/env python3
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # headless batch plotting, no GUI event loop
 import matplotlib.pyplot as plt
 import numpy as np
 import sys
 import os
 
+try:
+    import polars as pl
+except ImportError:  # optional; pandas' reader is used when polars is missing
+    pl = None
+
+FAILED_MARKERS = {'FAILED', 'ERROR', 'N/A'}
+NUMERIC_COLS = ['SimSeconds', 'TotalCycles', 'AvgIPC', 'TotalInstructions']
+CSV_COLUMNS = ['Configuration', 'OpLat', 'IssueLat', 'Threads'] + NUMERIC_COLS + ['Status']
+# Numeric columns are pinned to float so the frame never depends on type inference
+CSV_DTYPES = {'Threads': 'int16', 'OpLat': 'int8', 'IssueLat': 'int8',
+              **{col: 'float64' for col in NUMERIC_COLS}}
+
+def load_results(csv_file):
+    """Load the results CSV and drop failed experiments"""
+    
+    if pl is not None:
+        # Polars parses the CSV on all cores, which pays off for large sweeps
+        results = pl.read_csv(
+            csv_file,
+            columns=CSV_COLUMNS,
+            null_values=list(FAILED_MARKERS),
+            # Leading failed runs would otherwise make inference type these as strings
+            schema_overrides={'Threads': pl.Int16, 'OpLat': pl.Int8, 'IssueLat': pl.Int8,
+                              **{col: pl.Float64 for col in NUMERIC_COLS}},
+        ).with_row_index('row').drop_nulls(NUMERIC_COLS)
+        # Keep the CSV row numbers as the index, like pandas' dropna does
+        return pd.DataFrame({col: results.get_column(col).to_numpy() for col in CSV_COLUMNS},
+                            index=results.get_column('row').to_numpy())
+    
+    # Failure markers become NaN in the tokenizer, so numeric columns parse directly
+    df = pd.read_csv(csv_file, usecols=CSV_COLUMNS, dtype=CSV_DTYPES,
+                     na_values=FAILED_MARKERS)
+    return df.dropna(subset=NUMERIC_COLS)
+
 def analyze_results(csv_file):
     """Analyze the performance results and generate plots"""
     
     print("Loading results from:", csv_file)
-    df = pd.read_csv(csv_file)
+    df = load_results(csv_file)
     
     print("\nDataset overview:")
     print(df.head())
     
-    # Convert to numeric
-    df['SimSeconds'] = pd.to_numeric(df['SimSeconds'])
-    df['TotalCycles'] = pd.to_numeric(df['TotalCycles'])
-    df['AvgIPC'] = pd.to_numeric(df['AvgIPC'])
-    df['TotalInstructions'] = pd.to_numeric(df['TotalInstructions'])
+    # Speedup and efficiency relative to each configuration's single-thread run
+    base_times = df[df['Threads'] == 1].set_index('Configuration')['SimSeconds']
+    df['Speedup'] = df['Configuration'].map(base_times) / df['SimSeconds']
+    df['Efficiency'] = df['Speedup'] / df['Threads']
+    
+    # Partition the frame once; every plot and summary below reuses these groups
+    groups = {config: data for config, data in
+              df.sort_values('Threads', kind='stable').groupby('Configuration', sort=False)}
+    thread_groups = dict(list(df.groupby('Threads')))
     
     # Create visualizations
     fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    
-    # 1. Simulation Time vs Thread Count for each configuration
-    ax1 = axes[0, 0]
-    for config in df['Configuration'].unique():
-        config_data = df[df['Configuration'] == config]
-        ax1.plot(config_data['Threads'], config_data['SimSeconds'], 
-                marker='o', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
-    ax1.set_xlabel('Number of Threads')
-    ax1.set_ylabel('Simulation Time (seconds)')
-    ax1.set_title('Simulation Time vs Thread Count')
-    ax1.legend()
-    ax1.grid(True)
-    
-    # 2. IPC vs Thread Count
-    ax2 = axes[0, 1]
-    for config in df['Configuration'].unique():
-        config_data = df[df['Configuration'] == config]
-        ax2.plot(config_data['Threads'], config_data['AvgIPC'], 
-                marker='s', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
-    ax2.set_xlabel('Number of Threads')
-    ax2.set_ylabel('Instructions Per Cycle (IPC)')
-    ax2.set_title('IPC vs Thread Count')
-    ax2.legend()
-    ax2.grid(True)
-    
-    # 3. Speedup analysis
-    ax3 = axes[0, 2]
-    for config in df['Configuration'].unique():
-        config_data = df[df['Configuration'] == config].sort_values('Threads')
-        single_thread_time = config_data[config_data['Threads'] == 1]['SimSeconds'].iloc[0]
-        speedup = single_thread_time / config_data['SimSeconds']
-        ax3.plot(config_data['Threads'], speedup, 
-                marker='^', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
-    
-    # Add ideal speedup line
-    threads = [1, 2, 4, 8]
-    ax3.plot(threads, threads, 'k--', label='Ideal Speedup', alpha=0.7)
-    ax3.set_xlabel('Number of Threads')
-    ax3.set_ylabel('Speedup')
-    ax3.set_title('Parallel Speedup')
-    ax3.legend()
-    ax3.grid(True)
-    
-    # 4. OpLat vs IssueLat heatmap for 4 threads
-    ax4 = axes[1, 0]
-    thread_4_data = df[df['Threads'] == 4]
-    pivot_data = thread_4_data.pivot(index='OpLat', columns='IssueLat', values='SimSeconds')
-    im = ax4.imshow(pivot_data.values, cmap='RdYlBu_r', aspect='auto')
-    ax4.set_xticks(range(len(pivot_data.columns)))
-    ax4.set_yticks(range(len(pivot_data.index)))
-    ax4.set_xticklabels(pivot_data.columns)
-    ax4.set_yticklabels(pivot_data.index)
-    ax4.set_xlabel('Issue Latency')
-    ax4.set_ylabel('Operation Latency')
-    ax4.set_title('Simulation Time Heatmap (4 threads)')
-    plt.colorbar(im, ax=ax4)
-    
-    # 5. Configuration comparison bar chart
-    ax5 = axes[1, 1]
-    thread_counts = [1, 2, 4, 8]
-    x = np.arange(len(thread_counts))
-    width = 0.12
-    
-    configs = df['Configuration'].unique()
-    for i, config in enumerate(configs):
-        config_data = df[df['Configuration'] == config]
-        times = [config_data[config_data['Threads'] == t]['SimSeconds'].iloc[0] for t in thread_counts]
-        ax5.bar(x + i*width, times, width, label=f"{config}")
-    
-    ax5.set_xlabel('Thread Count')
-    ax5.set_ylabel('Simulation Time (seconds)')
-    ax5.set_title('Performance Comparison Across Configurations')
-    ax5.set_xticks(x + width * 2.5)
-    ax5.set_xticklabels(thread_counts)
-    ax5.legend()
-    ax5.grid(True, axis='y')
-    
-    # 6. Efficiency analysis
-    ax6 = axes[1, 2]
-    for config in df['Configuration'].unique():
-        config_data = df[df['Configuration'] == config].sort_values('Threads')
-        single_thread_time = config_data[config_data['Threads'] == 1]['SimSeconds'].iloc[0]
-        speedup = single_thread_time / config_data['SimSeconds']
-        efficiency = speedup / config_data['Threads'] * 100
-        ax6.plot(config_data['Threads'], efficiency, 
-                marker='d', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
-    
-    ax6.set_xlabel('Number of Threads')
-    ax6.set_ylabel('Parallel Efficiency (%)')
-    ax6.set_title('Parallel Efficiency')
-    ax6.legend()
-    ax6.grid(True)
-    ax6.set_ylim(0, 100)
-    
-    plt.tight_layout()
-    plt.savefig('floatsimdfu_analysis.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    try:
+        # 1. Simulation Time vs Thread Count for each configuration
+        ax1 = axes[0, 0]
+        for config, config_data in groups.items():
+            ax1.plot(config_data['Threads'], config_data['SimSeconds'], 
+                    marker='o', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
+        ax1.set_xlabel('Number of Threads')
+        ax1.set_ylabel('Simulation Time (seconds)')
+        ax1.set_title('Simulation Time vs Thread Count')
+        ax1.legend()
+        ax1.grid(True)
+        
+        # 2. IPC vs Thread Count
+        ax2 = axes[0, 1]
+        for config, config_data in groups.items():
+            ax2.plot(config_data['Threads'], config_data['AvgIPC'], 
+                    marker='s', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
+        ax2.set_xlabel('Number of Threads')
+        ax2.set_ylabel('Instructions Per Cycle (IPC)')
+        ax2.set_title('IPC vs Thread Count')
+        ax2.legend()
+        ax2.grid(True)
+        
+        # 3. Speedup analysis
+        ax3 = axes[0, 2]
+        for config, config_data in groups.items():
+            ax3.plot(config_data['Threads'], config_data['Speedup'], 
+                    marker='^', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
+        
+        # Add ideal speedup line
+        threads = [1, 2, 4, 8]
+        ax3.plot(threads, threads, 'k--', label='Ideal Speedup', alpha=0.7)
+        ax3.set_xlabel('Number of Threads')
+        ax3.set_ylabel('Speedup')
+        ax3.set_title('Parallel Speedup')
+        ax3.legend()
+        ax3.grid(True)
+        
+        # 4. OpLat vs IssueLat heatmap for 4 threads
+        ax4 = axes[1, 0]
+        thread_4_data = thread_groups[4]
+        pivot_data = thread_4_data.pivot(index='OpLat', columns='IssueLat', values='SimSeconds')
+        im = ax4.imshow(pivot_data.values, cmap='RdYlBu_r', aspect='auto')
+        ax4.set_xticks(range(len(pivot_data.columns)))
+        ax4.set_yticks(range(len(pivot_data.index)))
+        ax4.set_xticklabels(pivot_data.columns)
+        ax4.set_yticklabels(pivot_data.index)
+        ax4.set_xlabel('Issue Latency')
+        ax4.set_ylabel('Operation Latency')
+        ax4.set_title('Simulation Time Heatmap (4 threads)')
+        plt.colorbar(im, ax=ax4)
+        
+        # 5. Configuration comparison bar chart
+        ax5 = axes[1, 1]
+        thread_counts = [1, 2, 4, 8]
+        x = np.arange(len(thread_counts))
+        width = 0.12
+        
+        # One reshape gives every configuration's times in thread_counts order
+        times = (df.pivot(index='Configuration', columns='Threads', values='SimSeconds')
+                 .reindex(index=list(groups), columns=thread_counts).to_numpy())
+        for i, config in enumerate(groups):
+            ax5.bar(x + i*width, times[i], width, label=f"{config}")
+        
+        ax5.set_xlabel('Thread Count')
+        ax5.set_ylabel('Simulation Time (seconds)')
+        ax5.set_title('Performance Comparison Across Configurations')
+        ax5.set_xticks(x + width * 2.5)
+        ax5.set_xticklabels(thread_counts)
+        ax5.legend()
+        ax5.grid(True, axis='y')
+        
+        # 6. Efficiency analysis
+        ax6 = axes[1, 2]
+        for config, config_data in groups.items():
+            ax6.plot(config_data['Threads'], config_data['Efficiency'] * 100, 
+                    marker='d', label=f"{config} ({config_data['OpLat'].iloc[0]}/{config_data['IssueLat'].iloc[0]})")
+        
+        ax6.set_xlabel('Number of Threads')
+        ax6.set_ylabel('Parallel Efficiency (%)')
+        ax6.set_title('Parallel Efficiency')
+        ax6.legend()
+        ax6.grid(True)
+        ax6.set_ylim(0, 100)
+        
+        plt.tight_layout()
+        plt.savefig('floatsimdfu_analysis.png', dpi=150, bbox_inches='tight')
+    finally:
+        # Always release the figure so repeated runs keep a flat memory ceiling
+        plt.close(fig)
     
     # Generate summary table
     print("\n" + "="*80)
@@ -333,35 +366,24 @@ def analyze_results(csv_file):
     print("-" * 50)
     
     # Best for single-thread performance
-    single_thread = df[df['Threads'] == 1]
+    single_thread = thread_groups[1]
     best_single = single_thread.loc[single_thread['SimSeconds'].idxmin()]
     print(f"Best Single-Thread: {best_single['Configuration']} ({best_single['OpLat']}/{best_single['IssueLat']}) - {best_single['SimSeconds']:.6f}s")
     
     # Best for 8-thread performance
-    eight_thread = df[df['Threads'] == 8]
+    eight_thread = thread_groups[8]
     best_eight = eight_thread.loc[eight_thread['SimSeconds'].idxmin()]
     print(f"Best 8-Thread: {best_eight['Configuration']} ({best_eight['OpLat']}/{best_eight['IssueLat']}) - {best_eight['SimSeconds']:.6f}s")
     
     # Best overall speedup
-    speedups = []
-    for config in df['Configuration'].unique():
-        config_data = df[df['Configuration'] == config]
-        single_time = config_data[config_data['Threads'] == 1]['SimSeconds'].iloc[0]
-        eight_time = config_data[config_data['Threads'] == 8]['SimSeconds'].iloc[0]
-        speedup = single_time / eight_time
-        speedups.append((config, speedup, config_data['OpLat'].iloc[0], config_data['IssueLat'].iloc[0]))
-    
-    best_speedup = max(speedups, key=lambda x: x[1])
-    print(f"Best Speedup: {best_speedup[0]} ({best_speedup[2]}/{best_speedup[3]}) - {best_speedup[1]:.2f}x")
+    best_speedup = eight_thread.loc[eight_thread['Speedup'].idxmax()]
+    print(f"Best Speedup: {best_speedup['Configuration']} ({best_speedup['OpLat']}/{best_speedup['IssueLat']}) - {best_speedup['Speedup']:.2f}x")
     
     print("\n2. DETAILED RESULTS TABLE:")
     print("-" * 50)
-    summary_table = df.pivot_table(
-        index=['Configuration', 'OpLat', 'IssueLat'],
-        columns='Threads',
-        values='SimSeconds',
-        aggfunc='first'
-    )
+    # Each (configuration, thread count) appears once, so a plain reshape is enough
+    summary_table = (df.set_index(['Configuration', 'OpLat', 'IssueLat', 'Threads'])['SimSeconds']
+                     .unstack('Threads'))
     print(summary_table)
     
     print("\n3. KEY OBSERVATIONS:")
@@ -372,12 +394,9 @@ def analyze_results(csv_file):
     print("  - Balance depends on workload characteristics")
     
     print("\n• Thread Scaling Analysis:")
-    for config in df['Configuration'].unique():
-        config_data = df[df['Configuration'] == config].sort_values('Threads')
-        single_time = config_data[config_data['Threads'] == 1]['SimSeconds'].iloc[0]
-        eight_time = config_data[config_data['Threads'] == 8]['SimSeconds'].iloc[0]
-        speedup = single_time / eight_time
-        efficiency = speedup / 8 * 100
+    for config, speedup, efficiency in zip(eight_thread['Configuration'],
+                                           eight_thread['Speedup'],
+                                           eight_thread['Efficiency'] * 100):
         print(f"  - {config}: {speedup:.2f}x speedup, {efficiency:.1f}% efficiency")
 
 if __name__ == "__main__":
@@ -1,11 +1,75 @@
 #!/usr/bin/env python3
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
+import argparse
+import functools
 import os
 import sys
 
+import pandas as pd
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+STAT_COLUMNS = ['sim_ticks', 'sim_seconds', 'instructions', 'cycles']
+# Narrow dtypes keep every groupby/pivot/merge pass over fewer cache lines;
+# the stats only feed ratios, which are still computed in float64
+CSV_DTYPES = {'opLat': 'int16', 'issueLat': 'int16', 'threads': 'int16',
+              **{col: 'float32' for col in STAT_COLUMNS}}
+# Part of the Parquet cache name; bump it whenever the analyzed columns change
+CACHE_VERSION = 1
+# Below this many rows the baseline merge is cheaper than loading a JIT-compiled kernel
+NUMBA_MIN_ROWS = 10_000
+
+def _speedup_kernel(op_lat, issue_lat, threads, seconds):
+    """Speedups over rows sorted by (opLat, issueLat, threads) in a single walk"""
+    
+    speedup = np.empty(len(seconds))
+    i = 0
+    while i < len(seconds):
+        j = i
+        while j < len(seconds) and op_lat[j] == op_lat[i] and issue_lat[j] == issue_lat[i]:
+            j += 1
+        # Sorted by threads, so a single-thread baseline is the first row of its group
+        has_baseline = threads[i] == 1
+        for k in range(i, j):
+            if not has_baseline:
+                speedup[k] = 1.0
+            elif seconds[k] > 0:
+                speedup[k] = seconds[i] / seconds[k]
+            else:
+                speedup[k] = 0.0
+        i = j
+    return speedup
+
+@functools.lru_cache(maxsize=None)
+def _compiled_speedup_kernel():
+    """The njit-compiled speedup kernel, or None when numba is not installed"""
+    
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_speedup_kernel)
+
+def read_results_csv(csv_file):
+    """Parse the summary CSV into the CSV_DTYPES columns; ERROR cells become NaN"""
+    
+    if pacsv is not None:
+        # pyarrow's multithreaded reader converts straight to the explicit schema
+        convert_options = pacsv.ConvertOptions(
+            column_types={col: pa.from_numpy_dtype(np.dtype(dtype))
+                          for col, dtype in CSV_DTYPES.items()},
+            include_columns=list(CSV_DTYPES),
+            null_values=list(pacsv.ConvertOptions().null_values) + ['ERROR'])
+        return pacsv.read_csv(csv_file, convert_options=convert_options).to_pandas()
+    
+    return pd.read_csv(csv_file, usecols=list(CSV_DTYPES), dtype=CSV_DTYPES,
+                       na_values=['ERROR'])
+
 def load_and_analyze_results(csv_file):
     """Load simulation results and perform analysis"""
     
@@ -13,112 +77,169 @@ def load_and_analyze_results(csv_file):
         print(f"Results file {csv_file} not found!")
         return None
     
-    df = pd.read_csv(csv_file)
+    # Reuse the analyzed frame from a previous run while the CSV and CACHE_VERSION are unchanged
+    parquet_file = f"{os.path.splitext(csv_file)[0]}.v{CACHE_VERSION}.parquet"
+    if (os.path.exists(parquet_file)
+            and os.path.getmtime(parquet_file) >= os.path.getmtime(csv_file)):
+        try:
+            return pd.read_parquet(parquet_file)
+        except Exception:
+            pass  # no parquet engine or an unreadable cache; rebuild it below
     
-    # Filter out error rows
-    df = df[df['sim_ticks'] != 'ERROR'].copy()
-    df['sim_ticks'] = pd.to_numeric(df['sim_ticks'])
-    df['sim_seconds'] = pd.to_numeric(df['sim_seconds'])
-    df['instructions'] = pd.to_numeric(df['instructions'])
-    df['cycles'] = pd.to_numeric(df['cycles'])
+    # Explicit columns and dtypes skip type inference
+    df = read_results_csv(csv_file)
+    df = df.dropna(subset=STAT_COLUMNS)
     
     # Calculate derived metrics
-    df['ipc'] = df['instructions'] / df['cycles'].replace(0, np.nan)
-    df['speedup'] = 1.0  # Will be calculated per configuration
+    cycles = df['cycles'].to_numpy(dtype=np.float64)
+    ipc = np.full(cycles.shape, np.nan)
+    np.divide(df['instructions'].to_numpy(dtype=np.float64), cycles, out=ipc, where=cycles != 0)
+    df['ipc'] = ipc
     
     # Calculate speedup relative to single thread
-    speedups = []
-    for _, row in df.iterrows():
-        baseline = df[(df['opLat'] == row['opLat']) & 
-                      (df['issueLat'] == row['issueLat']) & 
-                      (df['threads'] == 1)]
-        if not baseline.empty:
-            baseline_time = baseline['sim_seconds'].iloc[0]
-            speedup = baseline_time / row['sim_seconds'] if row['sim_seconds'] > 0 else 0
-        else:
-            speedup = 1.0
-        speedups.append(speedup)
-    
-    df['speedup'] = speedups
+    kernel = _compiled_speedup_kernel() if len(df) > NUMBA_MIN_ROWS else None
+    if kernel is not None:
+        # Large tables: one compiled pass over the rows sorted by configuration
+        order = np.lexsort((df['threads'].to_numpy(), df['issueLat'].to_numpy(),
+                            df['opLat'].to_numpy()))
+        speedup = np.empty(len(df))
+        speedup[order] = kernel(df['opLat'].to_numpy()[order],
+                                df['issueLat'].to_numpy()[order],
+                                df['threads'].to_numpy()[order],
+                                df['sim_seconds'].to_numpy(dtype=np.float64)[order])
+        df['speedup'] = speedup
+    else:
+        # One join on the baseline rows
+        baseline = (df.loc[df['threads'] == 1, ['opLat', 'issueLat', 'sim_seconds']]
+                    .drop_duplicates(['opLat', 'issueLat'])
+                    .rename(columns={'sim_seconds': 'baseline_sec'}))
+        df = df.merge(baseline, on=['opLat', 'issueLat'], how='left')
+        sim_seconds = df['sim_seconds'].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            speedup = np.where(sim_seconds > 0,
+                               df['baseline_sec'].to_numpy(dtype=np.float64) / sim_seconds, 0.0)
+        # Configurations without a single-thread run keep a neutral speedup of 1
+        df['speedup'] = np.where(df['baseline_sec'].isna(), 1.0, speedup)
+        df = df.drop(columns='baseline_sec')
+    
+    # One categorical "(opLat,issueLat)" label per row so grouping works on integer codes
+    labels = '(' + df['opLat'].astype(str) + ',' + df['issueLat'].astype(str) + ')'
+    order = df.sort_values(['opLat', 'issueLat'], kind='stable').index
+    df['config'] = pd.Categorical(labels, categories=labels[order].unique(), ordered=True)
+    
+    # Write next to the cache and rename, so an interrupted run never leaves a truncated file
+    tmp_file = f"{parquet_file}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_file, compression='zstd')
+        os.replace(tmp_file, parquet_file)
+    except (ImportError, OSError):
+        # Caching is best effort; the next run just parses the CSV again
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
     return df
 
-def create_performance_plots(df, output_dir):
+def pivot_metrics(df):
+    """Pivot speedup and IPC by configuration and thread count in one pass
+    
+    Missing runs stay NaN so the line plots can leave gaps; the tables fill them with 0.
+    """
+    
+    return df.pivot_table(values=['speedup', 'ipc'], index=['opLat', 'issueLat'],
+                          columns='threads', aggfunc='first', observed=True)
+
+def create_performance_plots(df, output_dir, pivots):
     """Create performance analysis plots"""
     
     if df is None or df.empty:
         print("No data to plot!")
         return
     
+    # matplotlib is imported here so table-only runs never pay for it
+    import matplotlib
+    if not sys.stdout.isatty():
+        matplotlib.use('Agg')  # batch/CI runs only write the PNG
+    import matplotlib.pyplot as plt
+    
     plt.style.use('seaborn-v0_8')
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('FloatSimdFU Design Space Exploration Results', fontsize=16, fontweight='bold')
-    
-    # 1. Speedup vs Thread Count
-    configs = df.groupby(['opLat', 'issueLat'])
-    colors = plt.cm.viridis(np.linspace(0, 1, len(configs)))
-    
-    for i, ((op_lat, issue_lat), group) in enumerate(configs):
-        ax1.plot(group['threads'], group['speedup'], 
-                marker='o', label=f'({op_lat},{issue_lat})', 
-                color=colors[i], linewidth=2, markersize=6)
-    
-    ax1.plot([1, 8], [1, 8], 'k--', alpha=0.5, label='Ideal')
-    ax1.set_xlabel('Thread Count')
-    ax1.set_ylabel('Speedup')
-    ax1.set_title('Speedup vs Thread Count')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # 2. IPC vs Thread Count
-    for i, ((op_lat, issue_lat), group) in enumerate(configs):
-        ax2.plot(group['threads'], group['ipc'], 
-                marker='s', label=f'({op_lat},{issue_lat})', 
-                color=colors[i], linewidth=2, markersize=6)
-    
-    ax2.set_xlabel('Thread Count')
-    ax2.set_ylabel('Instructions Per Cycle (IPC)')
-    ax2.set_title('IPC vs Thread Count')
-    ax2.grid(True, alpha=0.3)
-    
-    # 3. Configuration Comparison (8 threads)
-    eight_thread_data = df[df['threads'] == 8].copy()
-    if not eight_thread_data.empty:
-        config_labels = [f"({row['opLat']},{row['issueLat']})" 
-                        for _, row in eight_thread_data.iterrows()]
-        ax3.bar(range(len(eight_thread_data)), eight_thread_data['speedup'], 
-                color=colors[:len(eight_thread_data)], alpha=0.7)
-        ax3.set_xlabel('Configuration (opLat, issueLat)')
-        ax3.set_ylabel('Speedup (8 threads)')
-        ax3.set_title('Configuration Performance Comparison')
-        ax3.set_xticks(range(len(config_labels)))
-        ax3.set_xticklabels(config_labels, rotation=45)
-        ax3.grid(True, axis='y', alpha=0.3)
-    
-    # 4. Efficiency Heatmap
-    pivot_data = df.pivot_table(values='speedup', index=['opLat', 'issueLat'], 
-                               columns='threads', fill_value=0)
-    efficiency_data = pivot_data.div(pivot_data.columns, axis=1)
-    
-    im = ax4.imshow(efficiency_data.values, cmap='RdYlGn', aspect='auto', vmin=0, vmax=1)
-    ax4.set_xlabel('Thread Count')
-    ax4.set_ylabel('Configuration')
-    ax4.set_title('Parallel Efficiency Heatmap')
-    
-    # Set labels
-    ax4.set_xticks(range(len(efficiency_data.columns)))
-    ax4.set_xticklabels(efficiency_data.columns)
-    ax4.set_yticks(range(len(efficiency_data.index)))
-    ax4.set_yticklabels([f"({op},{iss})" for op, iss in efficiency_data.index])
-    
-    plt.colorbar(im, ax=ax4, label='Efficiency')
-    
-    plt.tight_layout()
-    plot_file = os.path.join(output_dir, 'performance_analysis.png')
-    plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-    print(f"Performance plots saved to: {plot_file}")
-    plt.show()
+    try:
+        fig.suptitle('FloatSimdFU Design Space Exploration Results', fontsize=16, fontweight='bold')
+        
+        # One color per configuration category, shared by every subplot
+        config_names = df['config'].cat.categories.tolist()
+        colors = plt.cm.viridis(np.linspace(0, 1, len(config_names)))
+        
+        # Both line plots draw every configuration in one call from the shared pivot
+        thread_counts = pivots['speedup'].columns.to_numpy()
+        
+        # 1. Speedup vs Thread Count
+        ax1.set_prop_cycle(color=colors)
+        lines = ax1.plot(thread_counts, pivots['speedup'].to_numpy().T,
+                         marker='o', linewidth=2, markersize=6)
+        
+        ideal, = ax1.plot([1, 8], [1, 8], 'k--', alpha=0.5)
+        ax1.set_xlabel('Thread Count')
+        ax1.set_ylabel('Speedup')
+        ax1.set_title('Speedup vs Thread Count')
+        ax1.legend(lines + [ideal], config_names + ['Ideal'])
+        ax1.grid(True, alpha=0.3)
+        
+        # 2. IPC vs Thread Count
+        ax2.set_prop_cycle(color=colors)
+        ax2.plot(thread_counts, pivots['ipc'].to_numpy().T,
+                 marker='s', linewidth=2, markersize=6)
+        
+        ax2.set_xlabel('Thread Count')
+        ax2.set_ylabel('Instructions Per Cycle (IPC)')
+        ax2.set_title('IPC vs Thread Count')
+        ax2.grid(True, alpha=0.3)
+        
+        # 3. Configuration Comparison (8 threads)
+        eight_thread_data = df.loc[df['threads'] == 8, ['config', 'speedup']]
+        if not eight_thread_data.empty:
+            config_labels = eight_thread_data['config'].tolist()
+            ax3.bar(range(len(eight_thread_data)), eight_thread_data['speedup'], 
+                    color=colors[eight_thread_data['config'].cat.codes], alpha=0.7)
+            ax3.set_xlabel('Configuration (opLat, issueLat)')
+            ax3.set_ylabel('Speedup (8 threads)')
+            ax3.set_title('Configuration Performance Comparison')
+            ax3.set_xticks(range(len(config_labels)))
+            ax3.set_xticklabels(config_labels, rotation=45)
+            ax3.grid(True, axis='y', alpha=0.3)
+        
+        # 4. Efficiency Heatmap
+        pivot_data = pivots['speedup'].fillna(0)
+        efficiency_data = (pivot_data.to_numpy(dtype=np.float64)
+                           / pivot_data.columns.to_numpy(dtype=np.float64)[None, :])
+        
+        # A single QuadMesh on explicit cell edges; rows run top-down like the tables
+        rows, cols = efficiency_data.shape
+        im = ax4.pcolormesh(np.arange(cols + 1), np.arange(rows + 1), efficiency_data,
+                            cmap='RdYlGn', vmin=0, vmax=1)
+        ax4.invert_yaxis()
+        ax4.set_xlabel('Thread Count')
+        ax4.set_ylabel('Configuration')
+        ax4.set_title('Parallel Efficiency Heatmap')
+        
+        # Set labels
+        ax4.set_xticks(np.arange(cols) + 0.5)
+        ax4.set_xticklabels(pivot_data.columns)
+        ax4.set_yticks(np.arange(rows) + 0.5)
+        ax4.set_yticklabels([f"({op},{iss})" for op, iss in pivot_data.index])
+        
+        plt.colorbar(im, ax=ax4, label='Efficiency')
+        
+        plt.tight_layout()
+        plot_file = os.path.join(output_dir, 'performance_analysis.png')
+        plt.savefig(plot_file, dpi=150)
+        print(f"Performance plots saved to: {plot_file}")
+        if sys.stdout.isatty():
+            plt.show()
+    finally:
+        # Drop the Agg buffers even when plotting fails or show() returns
+        plt.close(fig)
 
-def print_summary_table(df):
+def print_summary_table(df, pivots):
     """Print summary performance table"""
     
     if df is None or df.empty:
@@ -130,14 +251,12 @@ def print_summary_table(df):
     print("="*80)
     
     # Speedup table
-    speedup_table = df.pivot_table(values='speedup', index=['opLat', 'issueLat'], 
-                                  columns='threads', fill_value=0)
+    speedup_table = pivots['speedup'].fillna(0)
     print("\nSpeedup Table:")
     print(speedup_table.round(3))
     
     # IPC table
-    ipc_table = df.pivot_table(values='ipc', index=['opLat', 'issueLat'], 
-                              columns='threads', fill_value=0)
+    ipc_table = pivots['ipc'].fillna(0)
     print("\nIPC Table:")
     print(ipc_table.round(3))
     
@@ -145,16 +264,25 @@ def print_summary_table(df):
     print(f"\n{'Thread Count':<12} {'Best Config':<15} {'Max Speedup':<12} {'Best IPC':<10}")
     print("-" * 55)
     
-    for threads in sorted(df['threads'].unique()):
-        thread_data = df[df['threads'] == threads]
-        best_speedup = thread_data.loc[thread_data['speedup'].idxmax()]
-        best_ipc = thread_data.loc[thread_data['ipc'].idxmax()]
+    # Row labels of the per-thread-count maxima, found in one groupby each
+    by_threads = df.groupby('threads')
+    best_sp = df.loc[by_threads['speedup'].idxmax()].set_index('threads')
+    best_ipc_rows = df.loc[by_threads['ipc'].idxmax()].set_index('threads')
+    
+    for threads in best_sp.index:
+        best_speedup = best_sp.loc[threads]
+        best_ipc = best_ipc_rows.loc[threads]
         
-        print(f"{threads:<12} ({int(best_speedup['opLat'])},{int(best_speedup['issueLat'])})"
-              f"{'(' + str(int(best_ipc['opLat'])) + ',' + str(int(best_ipc['issueLat'])) + ')':<15} "
+        print(f"{threads:<12} {best_speedup['config']}{best_ipc['config']:<15} "
               f"{best_speedup['speedup']:<12.3f} {best_ipc['ipc']:<10.3f}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Analyze FloatSimdFU simulation results")
+    parser.add_argument("--no-plots", action="store_true",
+                        default=os.environ.get('NO_PLOTS', '') not in ('', '0'),
+                        help="Only print the summary tables (also set by NO_PLOTS=1)")
+    args = parser.parse_args()
+    
     output_dir = os.path.expanduser("~/gem5_assignment/outputs")
     csv_file = os.path.join(output_dir, "simulation_summary.csv")
     
@@ -163,8 +291,11 @@ def main():
     
     if df is not None:
         print(f"Loaded {len(df)} simulation results")
-        print_summary_table(df)
-        create_performance_plots(df, output_dir)
+        # The summary tables and the efficiency heatmap share one pivot
+        pivots = pivot_metrics(df) if not df.empty else None
+        print_summary_table(df, pivots)
+        if not args.no_plots:
+            create_performance_plots(df, output_dir, pivots)
     else:
         print("No valid results found!")
 
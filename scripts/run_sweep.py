@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import os
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GEM5_BUILD = os.path.join(PROJECT_DIR, "..", "gem5", "build", "X86", "gem5.opt")
+CONFIG_SCRIPT = os.path.join(PROJECT_DIR, "configs", "minor_cpu_floatsimd_config.py")
+BINARY = os.path.join(PROJECT_DIR, "src", "multi_threaded_daxpy")
+VECTOR_SIZE = 10000
+ALPHA = 2.5
+
+# FloatSimdFU configurations: opLat + issueLat = 7
+CONFIGURATIONS = [
+    (1, 6, "Fast_Execute_Slow_Issue"),
+    (2, 5, "Balanced_Fast_Execute"),
+    (3, 4, "Balanced_Center"),
+    (4, 3, "Balanced_Fast_Issue"),
+    (5, 2, "Slow_Execute_Fast_Issue"),
+    (6, 1, "Slowest_Execute_Fastest_Issue"),
+]
+THREAD_COUNTS = [1, 2, 4, 8]
+
+SUMMARY_COLUMNS = ['Configuration', 'OpLat', 'IssueLat', 'Threads', 'SimSeconds',
+                   'TotalCycles', 'AvgIPC', 'TotalInstructions', 'Status']
+
+def stat_patterns(cpu_prefix):
+    """Regexes for the summary metrics of the CPUs named system.<cpu_prefix>N"""
+
+    # First matching line wins. gem5 23 writes simSeconds; older releases wrote sim_seconds
+    cpu = rf'^system\.{cpu_prefix}\d*\.'
+    return {
+        'SimSeconds': re.compile(r'^(?:simSeconds|sim_seconds)\s+(\S+)'),
+        'TotalCycles': re.compile(cpu + r'numCycles\s+(\S+)'),
+        'AvgIPC': re.compile(cpu + r'ipc\s+(\S+)'),
+        'TotalInstructions': re.compile(cpu + r'(?:committedInsts|numInsts)\s+(\S+)'),
+    }
+
+def extract_stats(stats_file, patterns):
+    """Pull the summary metrics out of a gem5 stats.txt"""
+
+    stats = dict.fromkeys(patterns, 'FAILED')
+    if not os.path.exists(stats_file):
+        return stats
+
+    remaining = dict(patterns)
+    with open(stats_file) as f:
+        for line in f:
+            for key, pattern in list(remaining.items()):
+                match = pattern.match(line)
+                if match:
+                    stats[key] = match.group(1)
+                    del remaining[key]
+            if not remaining:
+                break
+    return stats
+
+def run_simulation(args, results_dir, op_lat, issue_lat, description, num_threads):
+    """Run a single gem5 simulation in its own output directory"""
+
+    config_dir = os.path.join(results_dir, f"{description}_{num_threads}threads")
+    gem5_outdir = os.path.join(config_dir, "gem5_output")
+    os.makedirs(gem5_outdir, exist_ok=True)
+
+    cmd = [
+        args.gem5,
+        f"--outdir={gem5_outdir}",
+        CONFIG_SCRIPT,
+        f"--num-cpus={num_threads}",
+        f"--float-simd-op-lat={op_lat}",
+        f"--float-simd-issue-lat={issue_lat}",
+        "--caches",
+        "--l2cache",
+        f"--l1d-size={args.l1d_size}",
+        f"--l1d-assoc={args.l1d_assoc}",
+        f"--l2-size={args.l2_size}",
+        f"--l2-assoc={args.l2_assoc}",
+        f"--cmd={args.binary}",
+        f"--options={args.vector_size} {num_threads} {ALPHA}",
+    ]
+    if args.fast_forward:
+        cmd.append(f"--fast-forward={args.fast_forward}")
+
+    with open(os.path.join(config_dir, "simulation_output.txt"), "w") as out:
+        result = subprocess.run(cmd, cwd=PROJECT_DIR, stdout=out, stderr=subprocess.STDOUT)
+
+    # After a fast-forward the measured MinorCPUs are the switch_cpus; system.cpu
+    # holds the atomic CPUs that sat switched out for the whole measured region
+    cpu_prefix = 'switch_cpus' if args.fast_forward else 'cpu'
+    stats = extract_stats(os.path.join(gem5_outdir, "stats.txt"), stat_patterns(cpu_prefix))
+    status = 'SUCCESS' if result.returncode == 0 else 'FAILED'
+    return {'Configuration': description, 'OpLat': op_lat, 'IssueLat': issue_lat,
+            'Threads': num_threads, **stats, 'Status': status}
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the FloatSimdFU design space sweep in parallel")
+    parser.add_argument("--gem5", default=GEM5_BUILD, help="Path to gem5.opt")
+    parser.add_argument("--binary", default=BINARY, help="Benchmark binary to simulate")
+    parser.add_argument("--vector-size", type=int, default=VECTOR_SIZE, help="DAXPY vector size")
+    parser.add_argument("--l1d-size", default="32kB", help="L1 data cache size")
+    parser.add_argument("--l1d-assoc", type=int, default=8, help="L1 data cache associativity")
+    parser.add_argument("--l2-size", default="256kB", help="L2 cache size")
+    parser.add_argument("--l2-assoc", type=int, default=8, help="L2 cache associativity")
+    parser.add_argument("--fast-forward", type=int, default=None,
+                        help="Instructions to fast-forward with AtomicSimpleCPU before measuring")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Number of gem5 instances to run concurrently")
+    parser.add_argument("--results-dir", default=None, help="Output directory for this sweep")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.gem5):
+        print(f"Error: gem5 binary not found at {args.gem5}")
+        sys.exit(1)
+
+    results_dir = args.results_dir or os.path.join(
+        PROJECT_DIR, f"results_{datetime.now():%Y%m%d_%H%M%S}")
+    os.makedirs(results_dir, exist_ok=True)
+
+    points = [(op_lat, issue_lat, description, num_threads)
+              for op_lat, issue_lat, description in CONFIGURATIONS
+              for num_threads in THREAD_COUNTS]
+    print(f"Running {len(points)} simulations with {args.jobs} parallel jobs")
+    print(f"Results directory: {results_dir}")
+
+    # gem5 is single-threaded, so independent design points scale with host cores.
+    # Each job just waits on its gem5 subprocess, so threads are enough to fan out.
+    rows = {}
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(run_simulation, args, results_dir, *point): point
+                   for point in points}
+        for future in as_completed(futures):
+            point = futures[future]
+            op_lat, issue_lat, description, num_threads = point
+            try:
+                row = future.result()
+            except Exception as e:
+                # A point that could not even launch counts as failed; the rest still get saved
+                print(f"  {description} ({op_lat}/{issue_lat}) {num_threads} threads: error: {e}")
+                row = {**dict.fromkeys(SUMMARY_COLUMNS, 'FAILED'), 'Configuration': description,
+                       'OpLat': op_lat, 'IssueLat': issue_lat, 'Threads': num_threads}
+            rows[point] = row
+            print(f"  {description} ({op_lat}/{issue_lat}) {num_threads} threads: "
+                  f"{row['Status']}, sim_seconds={row['SimSeconds']}")
+
+    summary_file = os.path.join(results_dir, "performance_summary.csv")
+    with open(summary_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows[point] for point in points)
+
+    print(f"Results summary saved to: {summary_file}")
+
+if __name__ == "__main__":
+    main()